@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+SlideFlow Validation Benchmark
+==============================
+
+Measures the overhead of slide payload validation on a typical
+50-slide deck, as a share of the whole /api/export-pptx request path
+(JSON parsing, validation, create_enhanced_pptx and prs.save).
+
+Run: python bench_validation.py
+"""
+
+import json
+import timeit
+from io import BytesIO
+
+from slide_validation import SlideValidator
+
+NUM_SLIDES = 50
+REPEAT = 200
+EXPORT_REPEAT = 5
+
+
+def build_deck(num_slides=NUM_SLIDES):
+    """Build a deck shaped like what the editor sends to /api/export-pptx"""
+    slides = []
+    for i in range(num_slides):
+        slides.append({
+            "id": i + 1,
+            "title": f"Slide {i + 1}: Quarterly Results",
+            "content": "",
+            "notes": "Speaker notes for this slide. " * 5,
+            "color_theme": "blue",
+            "background_color": "#dbeafe",
+            "elements": [
+                {
+                    "id": f"title_{i}",
+                    "type": "text",
+                    "content": f"Slide {i + 1}: Quarterly Results",
+                    "x": 50, "y": 80, "width": 700, "height": 60,
+                    "style": {"fontSize": "24px", "fontWeight": "bold", "color": "#2563eb"}
+                },
+                {
+                    "id": f"content_{i}",
+                    "type": "text",
+                    "content": "A short summary of the key findings for this section. " * 3,
+                    "x": 50, "y": 180, "width": 700, "height": 80,
+                    "style": {"fontSize": "16px", "color": "#1e3a8a", "lineHeight": "1.5"}
+                },
+                {
+                    "id": f"bullets_{i}",
+                    "type": "text",
+                    "content": "\n".join(f"• Point {n}" for n in range(5)),
+                    "x": 50, "y": 280, "width": 700, "height": 170,
+                    "style": {"fontSize": "14px", "color": "#1e3a8a", "lineHeight": "1.8"}
+                },
+                {
+                    "id": f"table_{i}",
+                    "type": "table",
+                    "content": "",
+                    "x": 50, "y": 460, "width": 700, "height": 120,
+                    "tableData": {
+                        "rows": 4,
+                        "cols": 4,
+                        "cells": [[f"R{r}C{c}" for c in range(4)] for r in range(4)]
+                    }
+                }
+            ]
+        })
+    return slides
+
+
+def time_per_call(func, number):
+    """Best-of-five wall time for a single call, in seconds"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def load_exporter():
+    """Return create_enhanced_pptx if the server and python-pptx can be imported"""
+    try:
+        from server import PPTX_AVAILABLE, create_enhanced_pptx
+    except ImportError as e:
+        print(f"⚠️  Skipping PPTX export timing: {e}")
+        return None
+    if not PPTX_AVAILABLE:
+        print("⚠️  Skipping PPTX export timing: python-pptx is not available")
+        return None
+    return create_enhanced_pptx
+
+
+def export_deck(create_enhanced_pptx, slides):
+    prs = create_enhanced_pptx(slides)
+    prs.save(BytesIO())
+
+
+def main():
+    print("⏱️  SlideFlow Validation Benchmark")
+    print("=" * 34)
+
+    body = json.dumps({"slides": build_deck()})
+    slides = json.loads(body)["slides"]
+    validator = SlideValidator()
+
+    parse_time = time_per_call(lambda: json.loads(body), REPEAT)
+    validate_time = time_per_call(lambda: validator.validate(slides), REPEAT)
+
+    print(f"📄 Deck: {NUM_SLIDES} slides, {len(body) / 1024:.1f} KiB JSON body")
+    print(f"🧾 json.loads:        {parse_time * 1e3:8.2f} ms")
+    print(f"✅ validate():        {validate_time * 1e3:8.2f} ms")
+
+    create_enhanced_pptx = load_exporter()
+    if create_enhanced_pptx is None:
+        print(f"📊 Overhead:          {validate_time / parse_time * 100:8.1f}% of JSON parsing only")
+        return
+
+    export_time = time_per_call(lambda: export_deck(create_enhanced_pptx, slides), EXPORT_REPEAT)
+    total_time = parse_time + validate_time + export_time
+    print(f"📦 PPTX export+save:  {export_time * 1e3:8.2f} ms")
+    print(f"📊 Overhead:          {validate_time / total_time * 100:8.2f}% of the export request"
+          f" ({total_time * 1e3:.1f} ms total)")
+
+
+if __name__ == "__main__":
+    main()
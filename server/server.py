@@ -8,6 +8,8 @@ from datetime import datetime
 import logging
 from dotenv import load_dotenv
 from io import BytesIO
+from werkzeug.exceptions import BadRequest, HTTPException, UnsupportedMediaType
+from slide_validation import SlideValidator, SlideValidationError, load_limits
 try:
     from pptx import Presentation
     from pptx.util import Inches, Pt
@@ -28,6 +30,10 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app, origins=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001"])
 
+# Slide payload validation (limits configurable via .env)
+slide_validator = SlideValidator(**load_limits())
+app.config['MAX_CONTENT_LENGTH'] = slide_validator.max_body_bytes
+
 # Configure Gemini AI (Google GenAI)
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
 if GOOGLE_API_KEY and GOOGLE_API_KEY != 'your_gemini_api_key_here':
@@ -251,6 +257,20 @@ def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
+def parse_slides_request():
+    """Parse a deck request body and validate its slides before any work starts"""
+    # Oversized bodies raise RequestEntityTooLarge (MAX_CONTENT_LENGTH)
+    # before they are read, and are answered by the 413 handler
+    try:
+        data = request.get_json()
+    except UnsupportedMediaType as e:
+        raise SlideValidationError("Request Content-Type must be application/json") from e
+    except BadRequest as e:
+        raise SlideValidationError("Request body must be valid JSON") from e
+    if not isinstance(data, dict):
+        raise SlideValidationError("Request body must be a JSON object")
+    return slide_validator.validate_request(data)
+
 def create_enhanced_pptx(slides_data):
     if not PPTX_AVAILABLE:
         raise ImportError("python-pptx is not available")
@@ -420,6 +440,8 @@ def generate_slide():
             "message": "Slide generated successfully"
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating slide: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -440,7 +462,7 @@ def get_color_themes():
 def create_presentation():
     """Create or update presentation"""
     try:
-        data = request.get_json()
+        data = parse_slides_request()
         prompt = data.get('prompt', '')
         slides = data.get('slides', [])
         color_theme = data.get('color_theme', 'blue')
@@ -484,6 +506,8 @@ def create_presentation():
             "message": "Presentation created successfully"
         })
         
+    except (HTTPException, SlideValidationError):
+        raise
     except Exception as e:
         logger.error(f"Error creating presentation: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -497,7 +521,7 @@ def export_pptx():
         }), 500
     
     try:
-        data = request.get_json()
+        data = parse_slides_request()
         slides_data = data.get('slides', [])
         
         if not slides_data:
@@ -524,6 +548,8 @@ def export_pptx():
             download_name=filename
         )
         
+    except (HTTPException, SlideValidationError):
+        raise
     except Exception as e:
         logger.error(f"Error exporting PPTX: {str(e)}")
         return jsonify({"error": f"PPTX export failed: {str(e)}"}), 500
@@ -533,6 +559,14 @@ def export_pptx():
 def not_found(error):
     return jsonify({"error": "Endpoint not found"}), 404
 
+@app.errorhandler(SlideValidationError)
+def invalid_slides(error):
+    return jsonify({"error": str(error)}), 400
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({"error": f"Request body exceeds {slide_validator.max_body_bytes} bytes"}), 413
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify({"error": "Internal server error"}), 500
@@ -58,6 +58,21 @@ CORS_ORIGINS=http://localhost:3000,http://localhost:3001,http://127.0.0.1:3000
 LOG_LEVEL=INFO
 VOICE_ENABLED=true
 VOICE_LANGUAGE=en-US
+# Images are sent inline as base64 data URLs (about 4/3 of the file size),
+# so MAX_REQUEST_BYTES must leave room for every image in a deck
+MAX_REQUEST_BYTES=10485760
+MAX_SLIDES=200
+MAX_ELEMENTS_PER_SLIDE=100
+MAX_TABLE_ROWS=50
+MAX_TABLE_COLS=20
+MAX_TEXT_LENGTH=10000
+MAX_IMAGE_URL_LENGTH=8388608
+# Whole-deck budgets, bounding the work done by a PPTX export
+MAX_LINES_PER_ELEMENT=200
+MAX_TOTAL_ELEMENTS=2000
+MAX_TOTAL_TABLE_CELLS=2000
+MAX_TOTAL_TEXT_LENGTH=500000
+MAX_TOTAL_LINES=5000
 """
     
     try:
@@ -0,0 +1,301 @@
+"""
+Slide payload validation for the deck endpoints.
+
+Checks the shape and size of an incoming `slides` array before any
+python-pptx work starts, so oversized or malformed decks are rejected
+with a 400 instead of burning CPU and memory in create_enhanced_pptx.
+
+Every string the editor sends (the request's prompt and color_theme,
+slide fields, element fields, `style` values, `ai_metadata` values and
+table cells) is bounded by max_text_length, except `style.imageUrl`, which holds base64 data URLs
+and is bounded by max_image_url_length. Numeric fields and any keys
+outside the slide schema are bounded only by max_body_bytes.
+
+Per-field limits alone still let a small body describe an expensive
+deck (thousands of bullet lines or table cells), so validate() also
+enforces whole-deck budgets on elements, allocated table cells, text
+characters and element content lines. The line and cell budgets track
+what create_enhanced_pptx turns into paragraphs and table cells.
+"""
+
+import os
+
+# Default limits, overridable through the environment (.env)
+DEFAULT_LIMITS = {
+    "max_body_bytes": 10 * 1024 * 1024,
+    "max_slides": 200,
+    "max_elements_per_slide": 100,
+    "max_table_rows": 50,
+    "max_table_cols": 20,
+    "max_text_length": 10000,
+    "max_image_url_length": 8 * 1024 * 1024,
+    "max_lines_per_element": 200,
+    "max_total_elements": 2000,
+    "max_total_table_cells": 2000,
+    "max_total_text_length": 500000,
+    "max_total_lines": 5000,
+}
+
+_ENV_NAMES = {
+    "max_body_bytes": "MAX_REQUEST_BYTES",
+    "max_slides": "MAX_SLIDES",
+    "max_elements_per_slide": "MAX_ELEMENTS_PER_SLIDE",
+    "max_table_rows": "MAX_TABLE_ROWS",
+    "max_table_cols": "MAX_TABLE_COLS",
+    "max_text_length": "MAX_TEXT_LENGTH",
+    "max_image_url_length": "MAX_IMAGE_URL_LENGTH",
+    "max_lines_per_element": "MAX_LINES_PER_ELEMENT",
+    "max_total_elements": "MAX_TOTAL_ELEMENTS",
+    "max_total_table_cells": "MAX_TOTAL_TABLE_CELLS",
+    "max_total_text_length": "MAX_TOTAL_TEXT_LENGTH",
+    "max_total_lines": "MAX_TOTAL_LINES",
+}
+
+REQUEST_TEXT_FIELDS = ("prompt", "color_theme")
+SLIDE_TEXT_FIELDS = (
+    "title", "content", "notes", "theme", "layout", "color_theme", "background_color"
+)
+ELEMENT_TEXT_FIELDS = ("id", "type", "content")
+CELL_TYPES = (str, int, float, bool, type(None))
+
+
+class SlideValidationError(ValueError):
+    """Raised when a slides payload does not match the schema or limits"""
+
+
+def load_limits():
+    """Read validation limits from the environment, falling back to defaults"""
+    limits = dict(DEFAULT_LIMITS)
+    for key, env_name in _ENV_NAMES.items():
+        value = os.getenv(env_name)
+        if value:
+            try:
+                limit = int(value)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                raise ValueError(f"{env_name} must be a positive integer, got {value!r}")
+            limits[key] = limit
+    return limits
+
+
+def _path(where):
+    """Format a (slide_idx[, element_idx]) tuple as a readable payload path"""
+    path = f"slides[{where[0]}]"
+    if len(where) > 1:
+        path += f".elements[{where[1]}]"
+    return path
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class SlideValidator:
+    """Single-pass validator for the slide/element schema.
+
+    Limits are bound once at construction so validate() only does
+    closure-local lookups and type checks per element.
+    """
+
+    def __init__(self, **limits):
+        unknown = set(limits) - set(DEFAULT_LIMITS)
+        if unknown:
+            raise TypeError(f"Unknown limits: {', '.join(sorted(unknown))}")
+        self.limits = {**DEFAULT_LIMITS, **limits}
+        self.max_body_bytes = self.limits["max_body_bytes"]
+        self._check_slide = self._compile()
+
+    def _compile(self):
+        max_elements = self.limits["max_elements_per_slide"]
+        max_rows = self.limits["max_table_rows"]
+        max_cols = self.limits["max_table_cols"]
+        max_text = self.limits["max_text_length"]
+        max_image_url = self.limits["max_image_url_length"]
+        max_lines = self.limits["max_lines_per_element"]
+
+        def check_text(value, field, where):
+            if not isinstance(value, str):
+                raise SlideValidationError(f"{_path(where)}.{field} must be a string")
+            if len(value) > max_text:
+                raise SlideValidationError(
+                    f"{_path(where)}.{field} exceeds {max_text} characters"
+                )
+            return len(value)
+
+        def check_style(style, where):
+            if not isinstance(style, dict):
+                raise SlideValidationError(f"{_path(where)}.style must be an object")
+            text_length = 0
+            for key, value in style.items():
+                if isinstance(value, str):
+                    if key == "imageUrl":
+                        if len(value) > max_image_url:
+                            raise SlideValidationError(
+                                f"{_path(where)}.style.imageUrl exceeds {max_image_url} characters"
+                            )
+                    elif len(value) > max_text:
+                        raise SlideValidationError(
+                            f"{_path(where)}.style.{key} exceeds {max_text} characters"
+                        )
+                    else:
+                        text_length += len(value)
+                elif isinstance(value, list):
+                    for item in value:
+                        if not isinstance(item, str) or len(item) > max_text:
+                            raise SlideValidationError(
+                                f"{_path(where)}.style.{key} must contain strings of at most {max_text} characters"
+                            )
+                        text_length += len(item)
+                elif not isinstance(value, (int, float)):
+                    raise SlideValidationError(
+                        f"{_path(where)}.style.{key} must be a string, number or array"
+                    )
+            return text_length
+
+        def check_table(table_data, where):
+            if not isinstance(table_data, dict):
+                raise SlideValidationError(f"{_path(where)}.tableData must be an object")
+            rows = table_data.get("rows", 2)
+            cols = table_data.get("cols", 2)
+            if not _is_int(rows) or not 0 < rows <= max_rows:
+                raise SlideValidationError(
+                    f"{_path(where)}.tableData.rows must be an integer between 1 and {max_rows}"
+                )
+            if not _is_int(cols) or not 0 < cols <= max_cols:
+                raise SlideValidationError(
+                    f"{_path(where)}.tableData.cols must be an integer between 1 and {max_cols}"
+                )
+            cells = table_data.get("cells", [])
+            if not isinstance(cells, list):
+                raise SlideValidationError(f"{_path(where)}.tableData.cells must be an array")
+            if len(cells) > rows:
+                raise SlideValidationError(
+                    f"{_path(where)}.tableData.cells has more than {rows} rows"
+                )
+            text_length = 0
+            for row_idx, row in enumerate(cells):
+                if not isinstance(row, list):
+                    raise SlideValidationError(
+                        f"{_path(where)}.tableData.cells[{row_idx}] must be an array"
+                    )
+                if len(row) > cols:
+                    raise SlideValidationError(
+                        f"{_path(where)}.tableData.cells[{row_idx}] has more than {cols} columns"
+                    )
+                for cell in row:
+                    if not isinstance(cell, CELL_TYPES):
+                        raise SlideValidationError(
+                            f"{_path(where)}.tableData.cells[{row_idx}] contains a non-scalar value"
+                        )
+                    if isinstance(cell, str):
+                        if len(cell) > max_text:
+                            raise SlideValidationError(
+                                f"{_path(where)}.tableData.cells[{row_idx}] exceeds {max_text} characters"
+                            )
+                        text_length += len(cell)
+            # create_enhanced_pptx only adds a rows x cols table when cells are given
+            return (rows * cols if cells else 0), text_length
+
+        def check_slide(slide, slide_idx):
+            """Validate one slide and return its (table_cells, text_length, lines) totals"""
+            # Paths are index tuples, only formatted when an error is raised
+            slide_where = (slide_idx,)
+            if not isinstance(slide, dict):
+                raise SlideValidationError(f"{_path(slide_where)} must be an object")
+            table_cells = text_length = lines = 0
+            for field in SLIDE_TEXT_FIELDS:
+                if field in slide:
+                    text_length += check_text(slide[field], field, slide_where)
+            if "ai_metadata" in slide:
+                ai_metadata = slide["ai_metadata"]
+                if not isinstance(ai_metadata, dict):
+                    raise SlideValidationError(
+                        f"{_path(slide_where)}.ai_metadata must be an object"
+                    )
+                for key, value in ai_metadata.items():
+                    text_length += check_text(value, f"ai_metadata.{key}", slide_where)
+
+            elements = slide.get("elements", [])
+            if not isinstance(elements, list):
+                raise SlideValidationError(f"{_path(slide_where)}.elements must be an array")
+            if len(elements) > max_elements:
+                raise SlideValidationError(
+                    f"{_path(slide_where)} has more than {max_elements} elements"
+                )
+            for element_idx, element in enumerate(elements):
+                element_where = (slide_idx, element_idx)
+                if not isinstance(element, dict):
+                    raise SlideValidationError(f"{_path(element_where)} must be an object")
+                for field in ELEMENT_TEXT_FIELDS:
+                    if field in element:
+                        text_length += check_text(element[field], field, element_where)
+                if "content" in element:
+                    content_lines = element["content"].count("\n") + 1
+                    if content_lines > max_lines:
+                        raise SlideValidationError(
+                            f"{_path(element_where)}.content has more than {max_lines} lines"
+                        )
+                    lines += content_lines
+                if "style" in element:
+                    text_length += check_style(element["style"], element_where)
+                if element.get("type") == "table":
+                    cells, cell_text = check_table(element.get("tableData", {}), element_where)
+                    table_cells += cells
+                    text_length += cell_text
+
+            return len(elements), table_cells, text_length, lines
+
+        return check_slide
+
+    def validate(self, slides):
+        """Validate a slides array, raising SlideValidationError on the first problem"""
+        if not isinstance(slides, list):
+            raise SlideValidationError("slides must be an array")
+        max_slides = self.limits["max_slides"]
+        if len(slides) > max_slides:
+            raise SlideValidationError(f"Too many slides (maximum {max_slides})")
+        limits = self.limits
+        max_total_elements = limits["max_total_elements"]
+        max_total_cells = limits["max_total_table_cells"]
+        max_total_text = limits["max_total_text_length"]
+        max_total_lines = limits["max_total_lines"]
+        check_slide = self._check_slide
+        total_elements = total_cells = total_text = total_lines = 0
+        for slide_idx, slide in enumerate(slides):
+            elements, cells, text_length, lines = check_slide(slide, slide_idx)
+            total_elements += elements
+            total_cells += cells
+            total_text += text_length
+            total_lines += lines
+            # Deck-wide budgets are checked per slide so a bad deck fails early
+            if total_elements > max_total_elements:
+                raise SlideValidationError(
+                    f"Deck has more than {max_total_elements} elements in total"
+                )
+            if total_cells > max_total_cells:
+                raise SlideValidationError(
+                    f"Deck has more than {max_total_cells} table cells in total"
+                )
+            if total_text > max_total_text:
+                raise SlideValidationError(
+                    f"Deck has more than {max_total_text} characters of text in total"
+                )
+            if total_lines > max_total_lines:
+                raise SlideValidationError(
+                    f"Deck has more than {max_total_lines} lines of text in total"
+                )
+        return slides
+
+    def validate_request(self, data):
+        """Validate a deck request body: its top-level text fields and slides"""
+        max_text = self.limits["max_text_length"]
+        for field in REQUEST_TEXT_FIELDS:
+            if field in data:
+                value = data[field]
+                if not isinstance(value, str):
+                    raise SlideValidationError(f"{field} must be a string")
+                if len(value) > max_text:
+                    raise SlideValidationError(f"{field} exceeds {max_text} characters")
+        self.validate(data.get("slides", []))
+        return data
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import server
+
+DECK_ENDPOINTS = ["/api/presentai", "/api/export-pptx"]
+
+
+@pytest.fixture
+def client():
+    server.app.config["TESTING"] = True
+    return server.app.test_client()
+
+
+@pytest.fixture
+def small_body_limit(monkeypatch):
+    monkeypatch.setitem(server.app.config, "MAX_CONTENT_LENGTH", 100)
+
+
+def table_slide():
+    return {
+        "title": "Results",
+        "elements": [
+            {"type": "text", "content": "Summary"},
+            {"type": "table", "tableData": {"rows": 2, "cols": 2, "cells": [["a", "b"], ["c", "d"]]}},
+        ],
+    }
+
+
+@pytest.mark.parametrize("endpoint", ["/api/generate-slide"] + DECK_ENDPOINTS)
+def test_oversized_body_returns_413(client, small_body_limit, endpoint):
+    body = json.dumps({"prompt": "x" * 200, "slides": []})
+    response = client.post(endpoint, data=body, content_type="application/json")
+    assert response.status_code == 413
+    assert "exceeds" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("endpoint", DECK_ENDPOINTS)
+def test_malformed_json_returns_400(client, endpoint):
+    response = client.post(endpoint, data="{bad", content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Request body must be valid JSON"}
+
+
+@pytest.mark.parametrize("endpoint", DECK_ENDPOINTS)
+def test_non_json_content_type_returns_400(client, endpoint):
+    response = client.post(endpoint, data="slides", content_type="text/plain")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Request Content-Type must be application/json"}
+
+
+@pytest.mark.parametrize("endpoint", DECK_ENDPOINTS)
+@pytest.mark.parametrize("body", ["[]", "null", '"slides"'])
+def test_non_object_body_returns_400(client, endpoint, body):
+    response = client.post(endpoint, data=body, content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Request body must be a JSON object"}
+
+
+@pytest.mark.parametrize("endpoint", DECK_ENDPOINTS)
+def test_invalid_slides_return_400(client, endpoint):
+    response = client.post(endpoint, json={"slides": [{"title": 1}]})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "slides[0].title must be a string"}
+
+
+@pytest.mark.parametrize("field", ["prompt", "color_theme"])
+def test_presentai_rejects_long_top_level_text(client, field):
+    max_text = server.slide_validator.limits["max_text_length"]
+    response = client.post("/api/presentai", json={field: "x" * (max_text + 1), "slides": []})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": f"{field} exceeds {max_text} characters"}
+
+
+def test_presentai_stores_valid_deck(client):
+    response = client.post("/api/presentai", json={"prompt": "Manual save", "slides": [table_slide()]})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["slides"] == [table_slide()]
+    assert data["presentation_id"] in server.presentations
+
+
+@pytest.mark.skipif(not server.PPTX_AVAILABLE, reason="python-pptx is not installed")
+def test_export_pptx_returns_file(client):
+    response = client.post("/api/export-pptx", json={"slides": [table_slide()]})
+    assert response.status_code == 200
+    assert response.mimetype == (
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+    )
+    assert response.data[:2] == b"PK"
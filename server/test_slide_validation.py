@@ -0,0 +1,204 @@
+import pytest
+
+from slide_validation import (
+    DEFAULT_LIMITS,
+    SlideValidationError,
+    SlideValidator,
+    load_limits,
+)
+
+
+def client_slide():
+    """A slide shaped like client/types/slide.ts"""
+    return {
+        "id": 1,
+        "title": "Quarterly Results",
+        "content": "",
+        "notes": "Speaker notes",
+        "theme": "professional",
+        "layout": "bullet-list",
+        "color_theme": "blue",
+        "background_color": "#dbeafe",
+        "ai_metadata": {
+            "original_prompt": "quarterly results",
+            "generated_at": "2024-01-01T00:00:00",
+        },
+        "elements": [
+            {
+                "id": "title_1",
+                "type": "text",
+                "content": "Quarterly Results",
+                "x": 50, "y": 80, "width": 700, "height": 60,
+                "style": {"fontSize": "24px", "fontWeight": "bold", "textAlign": "left"},
+            },
+            {
+                "id": "list_1",
+                "type": "bulletList",
+                "content": "• One\n• Two",
+                "x": 50, "y": 180, "width": 700, "height": 80,
+                "style": {"listItems": ["One", "Two"]},
+            },
+            {
+                "id": "image_1",
+                "type": "image",
+                "content": "",
+                "x": 100, "y": 100, "width": 200, "height": 200,
+                "style": {"imageUrl": "data:image/png;base64," + "A" * 20000},
+            },
+            {
+                "id": "table_1",
+                "type": "table",
+                "content": "",
+                "x": 50, "y": 300, "width": 700, "height": 120,
+                "tableData": {"rows": 2, "cols": 2, "cells": [["a", "b"], ["c", "d"]]},
+            },
+        ],
+    }
+
+
+def table_slide(**table_data):
+    return {"elements": [{"type": "table", "tableData": table_data}]}
+
+
+@pytest.fixture
+def validator():
+    return SlideValidator(
+        max_slides=3,
+        max_elements_per_slide=2,
+        max_table_rows=3,
+        max_table_cols=3,
+        max_text_length=10,
+        max_image_url_length=20,
+    )
+
+
+def test_accepts_client_shaped_deck():
+    slides = [client_slide(), client_slide()]
+    assert SlideValidator().validate(slides) is slides
+
+
+def test_accepts_slide_without_optional_fields(validator):
+    validator.validate([{}, {"elements": []}])
+
+
+@pytest.mark.parametrize("slides, message", [
+    ({"title": "x"}, "slides must be an array"),
+    ([{}] * 4, "Too many slides"),
+    (["slide"], r"slides\[0\] must be an object"),
+    ([{"title": 1}], r"slides\[0\]\.title must be a string"),
+    ([{"notes": "x" * 11}], r"slides\[0\]\.notes exceeds 10 characters"),
+    ([{"background_color": "x" * 11}], r"background_color exceeds 10 characters"),
+    ([{"ai_metadata": "x"}], r"ai_metadata must be an object"),
+    ([{"ai_metadata": {"original_prompt": "x" * 11}}], r"ai_metadata\.original_prompt exceeds"),
+    ([{"elements": {}}], r"slides\[0\]\.elements must be an array"),
+    ([{"elements": [{}] * 3}], "has more than 2 elements"),
+    ([{"elements": [1]}], r"elements\[0\] must be an object"),
+    ([{"elements": [{"content": ["x"]}]}], r"elements\[0\]\.content must be a string"),
+    ([{"elements": [{"content": "x" * 11}]}], r"elements\[0\]\.content exceeds 10 characters"),
+    ([{"elements": [{"style": "x"}]}], r"style must be an object"),
+    ([{"elements": [{"style": {"color": "x" * 11}}]}], r"style\.color exceeds 10 characters"),
+    ([{"elements": [{"style": {"imageUrl": "x" * 21}}]}], r"style\.imageUrl exceeds 20 characters"),
+    ([{"elements": [{"style": {"listItems": ["x" * 11]}}]}], r"style\.listItems must contain strings"),
+    ([{"elements": [{"style": {"shape": {}}}]}], r"style\.shape must be a string, number or array"),
+])
+def test_rejects_invalid_slides(validator, slides, message):
+    with pytest.raises(SlideValidationError, match=message):
+        validator.validate(slides)
+
+
+@pytest.mark.parametrize("table_data, message", [
+    ({"rows": 4, "cols": 2}, r"rows must be an integer between 1 and 3"),
+    ({"rows": 0, "cols": 2}, r"rows must be an integer between 1 and 3"),
+    ({"rows": True, "cols": 2}, r"rows must be an integer between 1 and 3"),
+    ({"rows": 2, "cols": 4}, r"cols must be an integer between 1 and 3"),
+    ({"rows": 2, "cols": "2"}, r"cols must be an integer between 1 and 3"),
+    ({"rows": 2, "cols": 2, "cells": {}}, r"cells must be an array"),
+    ({"rows": 1, "cols": 2, "cells": [[], []]}, r"cells has more than 1 rows"),
+    ({"rows": 2, "cols": 2, "cells": ["ab"]}, r"cells\[0\] must be an array"),
+    ({"rows": 2, "cols": 2, "cells": [["a", "b", "c"]]}, r"cells\[0\] has more than 2 columns"),
+    ({"rows": 2, "cols": 2, "cells": [[{"a": 1}]]}, r"cells\[0\] contains a non-scalar value"),
+    ({"rows": 2, "cols": 2, "cells": [["x" * 11]]}, r"cells\[0\] exceeds 10 characters"),
+])
+def test_rejects_invalid_tables(validator, table_data, message):
+    with pytest.raises(SlideValidationError, match=message):
+        validator.validate([table_slide(**table_data)])
+
+
+def test_rejects_non_object_table_data(validator):
+    slides = [{"elements": [{"type": "table", "tableData": []}]}]
+    with pytest.raises(SlideValidationError, match="tableData must be an object"):
+        validator.validate(slides)
+
+
+def test_rejects_many_bullet_lines_with_default_limits():
+    # 294 KiB body that took 27 s in create_enhanced_pptx before deck budgets
+    slides = [{"elements": [{"type": "bulletList", "content": "a\n" * 5000}] * 20}]
+    with pytest.raises(SlideValidationError, match="more than 200 lines"):
+        SlideValidator().validate(slides)
+
+
+def test_rejects_many_table_cells_with_default_limits():
+    # 31 KiB body that took 2.8 s in create_enhanced_pptx before deck budgets
+    table = {"type": "table", "tableData": {"rows": 50, "cols": 20, "cells": [[0] * 20] * 50}}
+    slides = [{"elements": [table] * 10}]
+    with pytest.raises(SlideValidationError, match="more than 2000 table cells"):
+        SlideValidator().validate(slides)
+
+
+@pytest.mark.parametrize("limit, slides, message", [
+    ({"max_total_elements": 3}, [{"elements": [{}, {}]}] * 2, "more than 3 elements in total"),
+    ({"max_total_table_cells": 7}, [table_slide(rows=2, cols=2, cells=[["a"]])] * 2,
+     "more than 7 table cells in total"),
+    ({"max_total_text_length": 9}, [{"title": "abcde"}, {"notes": "abcde"}],
+     "more than 9 characters of text in total"),
+    ({"max_total_text_length": 9}, [{"elements": [{"style": {"color": "abcde", "listItems": ["abcde"]}}]}],
+     "more than 9 characters of text in total"),
+    ({"max_total_lines": 3}, [{"elements": [{"content": "a\nb"}]}] * 2, "more than 3 lines of text in total"),
+    ({"max_lines_per_element": 2}, [{"elements": [{"content": "a\nb\nc"}]}], r"content has more than 2 lines"),
+])
+def test_rejects_decks_over_budget(limit, slides, message):
+    with pytest.raises(SlideValidationError, match=message):
+        SlideValidator(**limit).validate(slides)
+
+
+def test_empty_table_cells_do_not_count_against_budget():
+    slides = [table_slide(rows=2, cols=2, cells=[])] * 3
+    SlideValidator(max_total_table_cells=1).validate(slides)
+
+
+def test_image_urls_do_not_count_against_text_budget():
+    slides = [{"elements": [{"style": {"imageUrl": "A" * 100}}]}]
+    SlideValidator(max_total_text_length=10).validate(slides)
+
+
+def test_rejects_unknown_limit():
+    with pytest.raises(TypeError, match="max_pages"):
+        SlideValidator(max_pages=1)
+
+
+def test_load_limits_defaults(monkeypatch):
+    for env_name in ("MAX_REQUEST_BYTES", "MAX_SLIDES", "MAX_ELEMENTS_PER_SLIDE",
+                     "MAX_TABLE_ROWS", "MAX_TABLE_COLS", "MAX_TEXT_LENGTH",
+                     "MAX_IMAGE_URL_LENGTH", "MAX_LINES_PER_ELEMENT",
+                     "MAX_TOTAL_ELEMENTS", "MAX_TOTAL_TABLE_CELLS",
+                     "MAX_TOTAL_TEXT_LENGTH", "MAX_TOTAL_LINES"):
+        monkeypatch.delenv(env_name, raising=False)
+    assert load_limits() == DEFAULT_LIMITS
+
+
+def test_load_limits_reads_environment(monkeypatch):
+    monkeypatch.setenv("MAX_SLIDES", "7")
+    monkeypatch.setenv("MAX_TABLE_ROWS", "9")
+    monkeypatch.setenv("MAX_TEXT_LENGTH", "")
+    limits = load_limits()
+    assert limits["max_slides"] == 7
+    assert limits["max_table_rows"] == 9
+    assert limits["max_text_length"] == DEFAULT_LIMITS["max_text_length"]
+    assert SlideValidator(**limits).limits["max_slides"] == 7
+
+
+@pytest.mark.parametrize("value", ["lots", "1.5", "0", "-1"])
+def test_load_limits_rejects_bad_integer(monkeypatch, value):
+    monkeypatch.setenv("MAX_SLIDES", value)
+    with pytest.raises(ValueError, match=f"MAX_SLIDES must be a positive integer, got '{value}'"):
+        load_limits()